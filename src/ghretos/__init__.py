@@ -19,7 +19,7 @@ from ghretos.models import (
     Repo,
     User,
 )
-from ghretos.parsing import parse_shorthand, parse_url
+from ghretos.parsing import parse_shorthand, parse_url, parse_urls
 
 
 __all__ = (
@@ -44,4 +44,5 @@ __all__ = (
     "User",
     "parse_shorthand",
     "parse_url",
+    "parse_urls",
 )
@@ -26,7 +26,11 @@ Pull Requests support reviews and review comments:
 - Review comments: ``/{owner}/{repo}/pull/{pr_number}#discussion_r2269233870``
 """  # noqa: E501
 
+import functools
+import re
 import string
+from collections.abc import Callable, Iterable, Sequence
+from typing import NamedTuple
 
 import yarl
 
@@ -36,12 +40,105 @@ from ghretos import models
 __all__ = (
     "parse_shorthand",
     "parse_url",
+    "parse_urls",
 )
 
 
 _DEFAULT_MATCHER_SETTINGS = models.MatcherSettings()
 
 
+class _Arm(NamedTuple):
+    """A resource that can be matched from a resource type and a fragment prefix."""
+
+    setting: str
+    """The name of the :obj:`.MatcherSettings` flag which enables this arm."""
+    model: Callable[..., models.GitHubResource]
+    """The model to construct."""
+    id_field: str | None = None
+    """The model field receiving the numeric id following the fragment prefix, if any."""
+
+
+_FAST_HOST_CHARS = frozenset(string.ascii_lowercase + string.digits + "-.")
+_FAST_PATH_CHARS = frozenset(string.ascii_letters + string.digits + "-._~/")
+_HEX_CHARS = frozenset(string.hexdigits)
+_SHORTHAND_CHARS = frozenset(string.ascii_letters + string.digits + "-._")
+
+_DASHED_FRAGMENT_PREFIXES = frozenset(
+    ("issue", "issuecomment", "event", "pullrequestreview", "discussion", "discussioncomment")
+)
+
+_REF_RE = re.compile(
+    r"(?!@\Z)"  # not the single character "@"
+    r"(?![./])"  # does not begin with a dot or a slash
+    r"(?!.*(?:\.\.|//|/\.|\./|\.lock/|@\{))"  # no forbidden sequences
+    r"(?!.*(?:\.lock|\.)\Z)"  # the last component does not end with ".lock" or "."
+    r"[^ \t\n\r\x0b\x0c~^:?*\[\\]+",  # no whitespace or forbidden characters
+    re.DOTALL,
+)
+
+# (resource type, fragment prefix) -> arm, for strictly typed numberable URLs.
+_STRICT_ARMS: dict[tuple[str, str | None], _Arm] = {
+    ("issues", ""): _Arm("issues", models.Issue),
+    ("issues", "issue-"): _Arm("issues", models.Issue),
+    ("issues", "issuecomment-"): _Arm("issue_comments", models.IssueComment, "comment_id"),
+    ("issues", "event-"): _Arm("issue_events", models.IssueEvent, "event_id"),
+    ("pull", ""): _Arm("pull_requests", models.PullRequest),
+    ("pull", "issue-"): _Arm("pull_requests", models.PullRequest),
+    ("pull", "issuecomment-"): _Arm(
+        "pull_request_comments", models.PullRequestComment, "comment_id"
+    ),
+    ("pull", "event-"): _Arm("pull_request_events", models.PullRequestEvent, "event_id"),
+    ("pull", "pullrequestreview-"): _Arm(
+        "pull_request_reviews", models.PullRequestReview, "review_id"
+    ),
+    ("pull", "discussion_r"): _Arm(
+        "pull_request_review_comments", models.PullRequestReviewComment, "comment_id"
+    ),
+    ("discussions", ""): _Arm("discussions", models.Discussion),
+    ("discussions", "discussion-"): _Arm("discussions", models.Discussion),
+    ("discussions", "discussioncomment-"): _Arm(
+        "discussion_comments", models.DiscussionComment, "comment_id"
+    ),
+}
+
+# Loosely typed URLs accept any fragment on any numberable resource type, except that issue links
+# and issue comments on pull requests resolve to the pull request variants.
+_LOOSE_ARMS: dict[tuple[str, str | None], _Arm] = {
+    **{
+        (resource_type, prefix): arm
+        for resource_type in ("issues", "pull", "discussions")
+        for prefix, arm in (
+            ("issue-", _Arm("issues", models.Issue)),
+            ("issuecomment-", _Arm("issue_comments", models.IssueComment, "comment_id")),
+            ("discussion-", _Arm("discussions", models.Discussion)),
+            (
+                "discussioncomment-",
+                _Arm("discussion_comments", models.DiscussionComment, "comment_id"),
+            ),
+            (
+                "pullrequestreview-",
+                _Arm("pull_request_review_comments", models.PullRequestReview, "review_id"),
+            ),
+            (
+                "discussion_r",
+                _Arm("pull_request_review_comments", models.PullRequestReviewComment, "comment_id"),
+            ),
+        )
+    },
+    ("issues", ""): _STRICT_ARMS["issues", ""],
+    ("pull", ""): _STRICT_ARMS["pull", ""],
+    ("pull", "issue-"): _STRICT_ARMS["pull", "issue-"],
+    ("pull", "issuecomment-"): _STRICT_ARMS["pull", "issuecomment-"],
+    ("discussions", ""): _STRICT_ARMS["discussions", ""],
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _repo(owner: str, name: str) -> models.Repo:
+    """Returns a shared :obj:`.Repo` for resources which belong to the same repository."""
+    return models.Repo(name=name, owner=owner)
+
+
 def _valid_user(user: str) -> bool:
     """Validates a GitHub username according to GitHub's rules."""
     if not (1 <= len(user) <= 39):
@@ -76,328 +173,137 @@ def _validate_ref(ref: str) -> bool:
 
     https://git-scm.com/docs/git-check-ref-format
     """
-    if not ref:
-        return False
+    return _REF_RE.fullmatch(ref) is not None
 
-    if ref == "@":
-        return False
-    last_char = ref[0]
-    if last_char in (".", "/"):
-        return False
-    if any(
-        phrase in ref
-        for phrase in ("..", "~", "^", ":", "?", "*", "[", "\\", "@{", "//", "/.", ".lock/")
-    ):
-        return False
-    for char in ref:
-        if char in string.whitespace:
-            return False
-        if last_char in (".") and char == "/":
-            return False
-        last_char = char
-
-    if any(c.endswith((".lock", ".")) or c.startswith(".") for c in ref.split("/")):  # noqa: SIM103
-        return False
 
-    return True
+def _parse_ascii_uint(value: str) -> int | None:
+    """Converts a string of ASCII digits to an int, or returns None for anything else."""
+    return int(value) if value.isascii() and value.isdigit() else None
 
 
-def _get_id_from_fragment(url: yarl.URL, prefix: str) -> str | None:
-    fragment = url.fragment
+def _get_id_from_fragment(fragment: str, prefix: str) -> str | None:
     if fragment.startswith(prefix):
         return fragment[len(prefix) :]
     return None
 
 
-def _parse_strict_numberable_url(
-    parsed_url: yarl.URL,
-    *,
-    settings: models.MatcherSettings,
-) -> models.GitHubResource | None:
-    path_and_fragment = list(parsed_url.parts)
-    if parsed_url.fragment:
-        path_and_fragment.append(f"#{parsed_url.fragment}")
-    _ = path_and_fragment.pop(0)
-    match path_and_fragment:
-        case [
-            owner,
-            repository,
-            "issues" | "pull" | "discussions" as resource_type,
-            resource_id,
-            *rest,
-        ]:
-            pass
-        case _:
-            return None
-    if not _valid_user(owner) or not _valid_repository(repository):
+def _fast_split(url: str) -> tuple[str, tuple[str, ...], str] | None:
+    """Splits a plain ``http(s)`` URL into its host, path segments, and fragment without yarl.
+
+    Returns None for anything yarl would normalise (ports, credentials, percent-encoding,
+    dot segments, uppercase hosts, ...), in which case the URL should be parsed by yarl instead.
+    """
+    if url.startswith("https://"):
+        rest = url[len("https://") :]
+    elif url.startswith("http://"):
+        rest = url[len("http://") :]
+    else:
+        return None
+    rest, _, fragment = rest.partition("#")
+    rest = rest.partition("?")[0]
+    host, slash, path = rest.partition("/")
+    if not host or host[-1] not in string.ascii_lowercase or not _FAST_HOST_CHARS.issuperset(host):
+        return None
+    if not _FAST_PATH_CHARS.issuperset(path) or "%" in fragment or not fragment.isprintable():
         return None
-    try:
-        resource_id = int(resource_id)
-    except ValueError:
+    parts = tuple(path.split("/")) if slash else ()
+    if "." in parts or ".." in parts:
+        return None
+    return host, parts, fragment
+
+
+def _split_fragment(fragment: str) -> tuple[str | None, str]:
+    """Splits a fragment such as ``issuecomment-123`` into its known prefix and its value.
+
+    The prefix is ``""`` when there is no fragment, and None when the fragment is not recognised.
+    """
+    if not fragment:
+        return "", ""
+    head, sep, value = fragment.partition("-")
+    if sep and head in _DASHED_FRAGMENT_PREFIXES:
+        return f"{head}-", value
+    if fragment.startswith("discussion_r"):
+        return "discussion_r", fragment[len("discussion_r") :]
+    return None, ""
+
+
+def _parse_review_comment_page(
+    rest: Sequence[str],
+    fragment: str,
+    *,
+    owner: str,
+    repository: str,
+    number: int,
+) -> models.PullRequestReviewComment | None:
+    """Parses a review comment linked from the commits or files page of a pull request."""
+    comment_id = _get_id_from_fragment(fragment, "r")
+    if not comment_id:
         return None
-    repo = models.Repo(name=repository, owner=owner)
-    # inject the resource_type for strict matching
-    rest.insert(0, resource_type)
     match rest:
-        case ["issues"] if settings.issues:
-            return models.Issue(repo=repo, number=resource_id)
-        case ["issues", fragment] if settings.issues and fragment.startswith("#issue-"):
-            return models.Issue(repo=repo, number=resource_id)
-        case ["pull"] if settings.pull_requests:
-            return models.PullRequest(repo=repo, number=resource_id)
-        case ["pull", fragment] if settings.pull_requests and fragment.startswith("#issue-"):
-            return models.PullRequest(repo=repo, number=resource_id)
-        case ["discussions"] if settings.discussions:
-            return models.Discussion(repo=repo, number=resource_id)
-        case ["discussions", fragment] if settings.discussions and fragment.startswith(
-            "#discussion-"
-        ):
-            return models.Discussion(repo=repo, number=resource_id)
-        case ["pull", "commits", sha, fragment] if settings.pull_request_review_comments and (
-            fragment := _get_id_from_fragment(parsed_url, "r")
-        ):
-            # Validate SHA is hexadecimal
-            try:
-                int(sha, 16)
-            except ValueError:
-                return None
-            try:
-                comment_id = int(fragment)
-            except ValueError:
+        case ["commits", sha] if sha and _HEX_CHARS.issuperset(sha):
+            comment_id = _parse_ascii_uint(comment_id)
+            if comment_id is None:
                 return None
             return models.PullRequestReviewComment(
-                repo=repo, number=resource_id, comment_id=comment_id, sha=sha, commit_page=True
+                repo=_repo(owner, repository),
+                number=number,
+                comment_id=comment_id,
+                sha=sha,
+                commit_page=True,
             )
         # Pull request review comments on /files page (no SHA allowed here)
-        case [
-            "pull",
-            "files",
-            fragment,
-        ] if settings.pull_request_review_comments and (
-            fragment := _get_id_from_fragment(parsed_url, "r")
-        ):
-            try:
-                comment_id = int(fragment)
-            except ValueError:
+        case ["files"]:
+            comment_id = _parse_ascii_uint(comment_id)
+            if comment_id is None:
                 return None
             return models.PullRequestReviewComment(
-                repo=repo,
-                number=resource_id,
+                repo=_repo(owner, repository),
+                number=number,
                 comment_id=comment_id,
                 commit_page=False,
                 files_page=True,
             )
-        # Issue with #issue- fragment
-        case ["issues", fragment] if settings.issues and fragment.startswith("#issue-"):
-            return models.Issue(repo=repo, number=resource_id)
-        # Issue comments
-        case ["issues", fragment] if settings.issue_comments and fragment.startswith(
-            "#issuecomment-"
-        ):
-            comment_id = fragment[len("#issuecomment-") :]
-            try:
-                comment_id = int(comment_id)
-            except ValueError:
-                return None
-            return models.IssueComment(repo=repo, number=resource_id, comment_id=comment_id)
-        # Pull request comments
-        case ["pull", fragment] if settings.pull_request_comments and fragment.startswith(
-            "#issuecomment-"
-        ):
-            comment_id = fragment[len("#issuecomment-") :]
-            try:
-                comment_id = int(comment_id)
-            except ValueError:
-                return None
-            return models.PullRequestComment(repo=repo, number=resource_id, comment_id=comment_id)
-        # Issue events
-        case ["issues", fragment] if settings.issue_events and fragment.startswith("#event-"):
-            event_id = fragment[len("#event-") :]
-            try:
-                event_id = int(event_id)
-            except ValueError:
-                return None
-            return models.IssueEvent(repo=repo, number=resource_id, event_id=event_id)
-        # Pull request events
-        case ["pull", fragment] if settings.pull_request_events and fragment.startswith("#event-"):
-            event_id = fragment[len("#event-") :]
-            try:
-                event_id = int(event_id)
-            except ValueError:
-                return None
-            return models.PullRequestEvent(
-                repo=repo,
-                number=resource_id,
-                event_id=event_id,
-            )
-        # Pull request reviews
-        case ["pull", fragment] if settings.pull_request_reviews and fragment.startswith(
-            "#pullrequestreview-"
-        ):
-            review_id = fragment[len("#pullrequestreview-") :]
-            try:
-                review_id = int(review_id)
-            except ValueError:
-                return None
-            return models.PullRequestReview(repo=repo, number=resource_id, review_id=review_id)
-        # Pull request review comments (discussion_r)
-        case ["pull", fragment] if settings.pull_request_review_comments and fragment.startswith(
-            "#discussion_r"
-        ):
-            comment_id = fragment[len("#discussion_r") :]
-            try:
-                comment_id = int(comment_id)
-            except ValueError:
-                return None
-            return models.PullRequestReviewComment(
-                repo=repo, number=resource_id, comment_id=comment_id
-            )
-        # Discussion comments
-        case ["discussions", fragment] if settings.discussion_comments and fragment.startswith(
-            "#discussioncomment-"
-        ):
-            comment_id = fragment[len("#discussioncomment-") :]
-            try:
-                comment_id = int(comment_id)
-            except ValueError:
-                return None
-            return models.DiscussionComment(repo=repo, number=resource_id, comment_id=comment_id)
         case _:
             return None
 
 
-def _parse_loose_numberable_url(
-    parsed_url: yarl.URL, *, settings: models.MatcherSettings
+def _parse_numberable_url(
+    owner: str,
+    repository: str,
+    rest: Sequence[str],
+    fragment: str,
+    *,
+    settings: models.MatcherSettings,
 ) -> models.GitHubResource | None:
-    path_and_fragment = list(parsed_url.parts)
-    if parsed_url.fragment:
-        path_and_fragment.append(f"#{parsed_url.fragment}")
-    _ = path_and_fragment.pop(0)
-    # assert the style of URL matches what we expect
-    match path_and_fragment:
-        case [
-            owner,
-            repository_name,
-            "issues" | "pull" | "discussions" as resource_type,
-            resource_id,
-            *rest,
-        ]:
-            pass
-        case _:
+    """Parses the ``{resource_type}/{number}/...`` part of an issue, pull or discussion URL."""
+    resource_type, resource_id, *rest = rest
+    resource_id = _parse_ascii_uint(resource_id)
+    if resource_id is None:
+        return None
+    if rest:
+        if resource_type != "pull" or not settings.pull_request_review_comments:
             return None
-    if not _valid_user(owner) or not _valid_repository(repository_name):
+        return _parse_review_comment_page(
+            rest, fragment, owner=owner, repository=repository, number=resource_id
+        )
+
+    # Everything else is decided by the resource type and the fragment prefix alone, so only the
+    # single setting that guards the matching arm is ever looked up.
+    prefix, value = _split_fragment(fragment)
+    arms = _STRICT_ARMS if settings.require_strict_type else _LOOSE_ARMS
+    arm = arms.get((resource_type, prefix))
+    if arm is None or not getattr(settings, arm.setting):
         return None
-    try:
-        resource_id = int(resource_id)
-    except ValueError:
+    if arm.id_field is None:
+        return arm.model(repo=_repo(owner, repository), number=resource_id)
+    item_id = _parse_ascii_uint(value)
+    if item_id is None:
         return None
-    repo = models.Repo(name=repository_name, owner=owner)
-    # inject the resource_type for loose matching
-    match rest:
-        case []:
-            if resource_type == "issues":
-                if settings.issues:
-                    return models.Issue(repo=repo, number=resource_id)
-            elif resource_type == "pull":
-                if settings.pull_requests:
-                    return models.PullRequest(repo=repo, number=resource_id)
-            elif resource_type == "discussions" and settings.discussions:
-                return models.Discussion(repo=repo, number=resource_id)
-            return None
-        case [fragment] if fragment.startswith("#issuecomment-"):
-            comment_id = fragment[len("#issuecomment-") :]
-            try:
-                comment_id = int(comment_id)
-            except ValueError:
-                return None
-            if resource_type == "pull":
-                return (
-                    models.PullRequestComment(repo=repo, number=resource_id, comment_id=comment_id)
-                    if settings.pull_request_comments
-                    else None
-                )
-            return (
-                models.IssueComment(repo=repo, number=resource_id, comment_id=comment_id)
-                if settings.issue_comments
-                else None
-            )
-        case [fragment] if settings.discussion_comments and fragment.startswith(
-            "#discussioncomment-"
-        ):
-            comment_id = fragment[len("#discussioncomment-") :]
-            try:
-                comment_id = int(comment_id)
-            except ValueError:
-                return None
-            return models.DiscussionComment(repo=repo, number=resource_id, comment_id=comment_id)
-        case [fragment] if fragment.startswith(("#issue-", "#discussion-")):
-            if fragment.startswith("#issue-"):
-                if resource_type == "pull":
-                    return (
-                        models.PullRequest(repo=repo, number=resource_id)
-                        if settings.pull_requests
-                        else None
-                    )
-                return models.Issue(repo=repo, number=resource_id) if settings.issues else None
-            elif fragment.startswith("#discussion-"):
-                return (
-                    models.Discussion(repo=repo, number=resource_id)
-                    if settings.discussions
-                    else None
-                )
-            return None
-        case [fragment] if settings.pull_request_review_comments and (
-            fragment.startswith(("#pullrequestreview-", "#discussion_r"))
-        ):
-            if fragment.startswith("#pullrequestreview-"):
-                review_id = fragment.removeprefix("#pullrequestreview-")
-                try:
-                    review_id = int(review_id)
-                except ValueError:
-                    return None
-                return models.PullRequestReview(repo=repo, number=resource_id, review_id=review_id)
-            elif fragment.startswith("#discussion_r"):
-                comment_id = fragment.removeprefix("#discussion_r")
-                try:
-                    comment_id = int(comment_id)
-                except ValueError:
-                    return None
-                return models.PullRequestReviewComment(
-                    repo=repo, number=resource_id, comment_id=comment_id
-                )
-            return None
-        case ["commits", sha, fragment] if (
-            settings.pull_request_review_comments
-            and resource_type == "pull"
-            and (fragment := _get_id_from_fragment(parsed_url, "r"))
-        ):
-            # Validate SHA is hexadecimal
-            try:
-                int(sha, 16)
-            except ValueError:
-                return None
-            return models.PullRequestReviewComment(
-                repo=repo,
-                number=resource_id,
-                comment_id=int(fragment),
-                sha=sha,
-                commit_page=True,
-            )
-        # Pull request review comments on files page
-        case ["files", fragment] if (
-            settings.pull_request_review_comments
-            and resource_type == "pull"
-            and (fragment := _get_id_from_fragment(parsed_url, "r"))
-        ):
-            return models.PullRequestReviewComment(
-                repo=repo,
-                number=resource_id,
-                comment_id=int(fragment),
-                commit_page=False,
-                files_page=True,
-            )
-        case _:
-            return None
+    return arm.model(
+        repo=_repo(owner, repository),
+        number=resource_id,
+        **{arm.id_field: item_id},
+    )
 
 
 # TODO: check yarl documentation regarding encoded or decoded values
@@ -424,66 +330,86 @@ def parse_url(
         A ParsedResource instance if the URL corresponds to a known GitHub resource,
         None otherwise.
     """
-    if not isinstance(url, yarl.URL):
-        parsed_url = yarl.URL(url)
-    else:
-        parsed_url = url
-    if not parsed_url.absolute or parsed_url.host_port_subcomponent not in settings.domains:
+    if settings is _DEFAULT_MATCHER_SETTINGS:
+        return _parse_default_url(url)
+    return _parse_url(url, settings=settings)
+
+
+def parse_urls(
+    urls: Iterable[str | yarl.URL],
+    *,
+    settings: models.MatcherSettings = _DEFAULT_MATCHER_SETTINGS,
+) -> list[models.GitHubResource | None]:
+    """Parses many GitHub URLs at once.
+
+    Equivalent to ``[parse_url(url, settings=settings) for url in urls]``.
+
+    Args:
+        urls: The URLs to parse.
+        settings: :obj:`.MatcherSettings` for the URL matcher.
+    Returns:
+        A list with the parsed resource, or None, for each URL in order.
+    """
+    if settings is _DEFAULT_MATCHER_SETTINGS:
+        return [_parse_default_url(url) for url in urls]
+    return [_parse_url(url, settings=settings) for url in urls]
+
+
+@functools.lru_cache(maxsize=8192)
+def _parse_default_url(url: str | yarl.URL) -> models.GitHubResource | None:
+    """Parses a URL with the default settings, caching the result for repeated URLs."""
+    return _parse_url(url, settings=_DEFAULT_MATCHER_SETTINGS)
+
+
+def _parse_url(
+    url: str | yarl.URL, *, settings: models.MatcherSettings
+) -> models.GitHubResource | None:
+    split = _fast_split(url) if isinstance(url, str) else None
+    if split is None:
+        parsed_url = url if isinstance(url, yarl.URL) else yarl.URL(url)
+        if not parsed_url.absolute:
+            return None
+        # Only percent-encoded fragments need to be decoded by yarl.
+        fragment = parsed_url.raw_fragment
+        if "%" in fragment:
+            fragment = parsed_url.fragment
+        split = (parsed_url.host_port_subcomponent, parsed_url.parts[1:], fragment)
+    host, parts, fragment = split
+    if host not in settings.domains:
         return None
-    path_and_fragment = list(parsed_url.parts)
-    if parsed_url.fragment:
-        path_and_fragment.append(f"#{parsed_url.fragment}")
-    _ = path_and_fragment.pop(0)
+    return _parse_path(parts, fragment, settings=settings)
 
-    if settings.require_strict_type:
-        result = _parse_strict_numberable_url(parsed_url, settings=settings)
-    else:
-        result = _parse_loose_numberable_url(parsed_url, settings=settings)
-    if result is not None:
-        return result
+
+def _parse_path(
+    parts: Sequence[str], fragment: str, *, settings: models.MatcherSettings
+) -> models.GitHubResource | None:
+    """Parses the decoded path segments and fragment of a URL on a GitHub domain."""
     # Case normalisation is not performed on GitHub's end, so we do not do it here either.
-    match path_and_fragment:
-        case [""] | []:
+    match parts:
+        case [owner] if not fragment and _valid_user(owner):
+            return models.User(login=owner)
+        case [owner, repository, *rest] if _valid_user(owner) and _valid_repository(repository):
+            pass
+        case _:
             return None
-        case [owner, *rest] if _valid_user(owner):
-            if not rest:
-                return models.User(login=owner)
-            match rest:
-                case [repository_name, *rest] if _valid_repository(repository_name):
-                    repo = models.Repo(name=repository_name, owner=owner)
-                    if not rest:
-                        return repo
-                    match rest:
-                        case ["commit", sha] if settings.commits:
-                            return models.Commit(repo=repo, sha=sha)
-                        case ["commit", sha, fragment] if (
-                            settings.commit_comments and fragment.startswith("#commitcomment-")
-                        ):
-                            comment_id = fragment[len("#commitcomment-") :]
-                            try:
-                                comment_id = int(comment_id)
-                            except ValueError:
-                                return None
-                            return models.CommitComment(repo=repo, sha=sha, comment_id=comment_id)
-                        case ["releases", "tag", tag] if settings.releases:
-                            return models.ReleaseTag(repo=repo, tag=tag)
-                        case ["commit", sha] if settings.commits:
-                            return models.Commit(repo=repo, sha=sha)
-                        case ["commit", sha, fragment] if (
-                            settings.commit_comments and fragment.startswith("#commitcomment-")
-                        ):
-                            comment_id = fragment[len("#commitcomment-") :]
-                            try:
-                                comment_id = int(comment_id)
-                            except ValueError:
-                                return None
-                            return models.CommitComment(repo=repo, sha=sha, comment_id=comment_id)
-                        case ["releases", "tag", tag] if settings.releases:
-                            return models.ReleaseTag(repo=repo, tag=tag)
-                        case _:
-                            return None
-                case _:
-                    return None
+    match rest, fragment:
+        case [], "":
+            return _repo(owner, repository)
+        case ["issues" | "pull" | "discussions", _, *_], _:
+            return _parse_numberable_url(owner, repository, rest, fragment, settings=settings)
+        case ["commit", sha], "" if settings.commits:
+            return models.Commit(repo=_repo(owner, repository), sha=sha)
+        case ["commit", sha], _ if settings.commit_comments and fragment.startswith(
+            "commitcomment-"
+        ):
+            comment_id = _parse_ascii_uint(fragment[len("commitcomment-") :])
+            if comment_id is None:
+                return None
+            return models.CommitComment(
+                repo=_repo(owner, repository), sha=sha, comment_id=comment_id
+            )
+        case ["releases", "tag", tag], "" if settings.releases:
+            return models.ReleaseTag(repo=_repo(owner, repository), tag=tag)
         case _:
             return None
 
@@ -510,13 +436,26 @@ def parse_shorthand(
     No requests are made to GitHub; this is purely syntactic parsing.
     No validation is performed on the parsed values, they are simply returned as-is.
     """
+    if settings is _DEFAULT_MATCHER_SETTINGS:
+        return _parse_default_shorthand(shorthand, default_user)
+    return _parse_shorthand(shorthand, default_user=default_user, settings=settings)
+
+
+@functools.lru_cache(maxsize=8192)
+def _parse_default_shorthand(
+    shorthand: str, default_user: str | None
+) -> models.GitHubResource | None:
+    """Parses a shorthand with the default settings, caching the result for repeated shorthands."""
+    return _parse_shorthand(
+        shorthand, default_user=default_user, settings=_DEFAULT_MATCHER_SETTINGS
+    )
+
+
+def _parse_shorthand(
+    shorthand: str, *, default_user: str | None, settings: models.MatcherSettings
+) -> models.GitHubResource | None:
     if not settings.shorthand:
         return None
-    # Iterate once.
-    user: str = ""
-    repo: str = ""
-    ref_type: str = ""
-
     if "/" in shorthand:
         user, shorthand = shorthand.split("/", 1)
     elif default_user is None:
@@ -524,31 +463,25 @@ def parse_shorthand(
     else:
         user = default_user
 
-    # validate the user
-    for char in user:
-        if char not in string.ascii_letters + string.digits + "-._":
-            return None
-
-    for char in shorthand:
-        if char in ("#", "@"):
-            ref_type = char
-            break
-        if char not in string.ascii_letters + string.digits + "-._":
-            return None
-        repo += char
+    # The repository ends at the first "#" or "@", whichever comes first.
+    ends = [index for index in (shorthand.find("#"), shorthand.find("@")) if index != -1]
+    if ends:
+        end = min(ends)
+        repo, ref_type, ref = shorthand[:end], shorthand[end], shorthand[end + 1 :]
     else:
-        return models.Repo(name=repo, owner=user) if settings.short_repo else None
+        repo, ref_type, ref = shorthand, "", ""
+
+    if not _SHORTHAND_CHARS.issuperset(user) or not _SHORTHAND_CHARS.issuperset(repo):
+        return None
+    if not ref_type:
+        return _repo(user, repo) if settings.short_repo else None
 
-    ref = shorthand[len(repo) + 1 :]
     if ref_type == "#":
-        try:
-            number = int(ref)
-        except ValueError:
-            return None
-        if number < 1:
+        number = _parse_ascii_uint(ref)
+        if number is None or number < 1:
             return None
         return (
-            models.NumberedResource(repo=models.Repo(name=repo, owner=user), number=number)
+            models.NumberedResource(repo=_repo(user, repo), number=number)
             if settings.short_numberables
             else None
         )
@@ -556,9 +489,5 @@ def parse_shorthand(
         # Check the type of ref matches allowed patterns
         if not _validate_ref(ref):
             return None
-        return (
-            models.Ref(repo=models.Repo(name=repo, owner=user), ref=ref)
-            if settings.short_refs
-            else None
-        )
+        return models.Ref(repo=_repo(user, repo), ref=ref) if settings.short_refs else None
     return None
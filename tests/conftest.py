@@ -0,0 +1,10 @@
+import os
+
+from hypothesis import settings
+
+
+# CI runners are shared and the example database is thrown away after each run,
+# so timing deadlines only cause flakes and database writes are wasted I/O.
+settings.register_profile("ci", deadline=None, database=None)
+settings.register_profile("dev", max_examples=25)
+settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "ci" if "CI" in os.environ else "default"))
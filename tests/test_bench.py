@@ -0,0 +1,47 @@
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+import ghretos
+
+
+pytest.importorskip("pytest_benchmark")
+
+CORPUS = [
+    "https://github.com/owner",
+    "https://github.com/owner/repo",
+    "https://github.com/owner/repo/issues/123",
+    "https://github.com/owner/repo/issues/123#issue-456",
+    "https://github.com/owner/repo/issues/123#issuecomment-456",
+    "https://github.com/owner/repo/issues/123#event-456",
+    "https://github.com/owner/repo/pull/123",
+    "https://github.com/owner/repo/pull/123#issuecomment-456",
+    "https://github.com/owner/repo/pull/123#event-456",
+    "https://github.com/owner/repo/pull/123#pullrequestreview-456",
+    "https://github.com/owner/repo/pull/123#discussion_r456",
+    "https://github.com/owner/repo/pull/123/commits/abc123#r456",
+    "https://github.com/owner/repo/pull/123/files#r456",
+    "https://github.com/owner/repo/discussions/123",
+    "https://github.com/owner/repo/discussions/123#discussioncomment-456",
+    "https://github.com/owner/repo/commit/abc123",
+    "https://github.com/owner/repo/commit/abc123#commitcomment-456",
+    "https://github.com/owner/repo/releases/tag/v1.0.0",
+    "https://github.com/owner/repo/issues/abc",
+    "https://example.com/owner/repo/issues/123",
+]
+
+
+def test_parse_url_uncached(benchmark: Callable[..., Any]) -> None:
+    # A settings instance other than the default one bypasses the result cache.
+    settings = ghretos.MatcherSettings()
+    benchmark(lambda: [ghretos.parse_url(url, settings=settings) for url in CORPUS])
+
+
+def test_parse_urls_cached(benchmark: Callable[..., Any]) -> None:
+    benchmark(ghretos.parse_urls, CORPUS)
+
+
+def test_parse_issue_url_uncached(benchmark: Callable[..., Any]) -> None:
+    settings = ghretos.MatcherSettings()
+    benchmark(ghretos.parse_url, "https://github.com/owner/repo/issues/123", settings=settings)
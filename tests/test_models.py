@@ -3,14 +3,35 @@ import dataclasses
 import ghretos
 
 
+# Collected once; with postponed annotations field.type would be the string "bool" and
+# match nothing, which test_none_is_none guards against.
+_BOOL_FIELDS = tuple(
+    field.name for field in dataclasses.fields(ghretos.MatcherSettings) if field.type is bool
+)
+
+
 class TestMatcherSettings:
     def test_none_is_none(self) -> None:
         """Test that MatcherSettings with all features disabled behaves correctly."""
+        assert _BOOL_FIELDS
         settings = ghretos.MatcherSettings.none()
-        for attr in dataclasses.fields(settings):
-            if attr.type is not bool:
-                continue
-            assert getattr(settings, attr.name) is False
+        for name in _BOOL_FIELDS:
+            assert getattr(settings, name) is False
+
+    def test_domains_reassignment(self) -> None:
+        """Test that assigning new domains is picked up by the URL parser."""
+        settings = ghretos.MatcherSettings(domains=["ghe.example.com"])
+        assert ghretos.parse_url("https://ghe.example.com/owner", settings=settings) is not None
+        assert ghretos.parse_url("https://github.com/owner", settings=settings) is None
+        settings.domains = ["github.com"]
+        assert ghretos.parse_url("https://ghe.example.com/owner", settings=settings) is None
+        assert ghretos.parse_url("https://github.com/owner", settings=settings) is not None
+
+    def test_domains_mutation(self) -> None:
+        """Test that domains appended in place are picked up by the URL parser."""
+        settings = ghretos.MatcherSettings()
+        settings.domains.append("ghe.example.com")
+        assert ghretos.parse_url("https://ghe.example.com/owner", settings=settings) is not None
 
 
 def test_repo_full_name() -> None: